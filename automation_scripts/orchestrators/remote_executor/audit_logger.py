@@ -6,35 +6,41 @@ No passwords or raw keys are ever logged.
 """
 
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 # Module-level logger; can be redirected to file/database via app config
 _logger: Optional[logging.Logger] = None
+_logger_lock = threading.Lock()
 
 
 def get_audit_logger() -> logging.Logger:
-    """Return the audit logger instance. Creates one if not set."""
+    """Return the audit logger instance. Creates one if not set (thread-safe; published only once configured)."""
     global _logger
     if _logger is None:
-        _logger = logging.getLogger("remote_executor.audit")
-        if not _logger.handlers:
-            h = logging.StreamHandler()
-            h.setFormatter(
-                logging.Formatter(
-                    "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
-                    datefmt="%Y-%m-%d %H:%M:%S",
-                )
-            )
-            _logger.addHandler(h)
-            _logger.setLevel(logging.INFO)
+        with _logger_lock:
+            if _logger is None:
+                logger = logging.getLogger("remote_executor.audit")
+                if not logger.handlers:
+                    h = logging.StreamHandler()
+                    h.setFormatter(
+                        logging.Formatter(
+                            "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+                            datefmt="%Y-%m-%d %H:%M:%S",
+                        )
+                    )
+                    logger.addHandler(h)
+                    logger.setLevel(logging.INFO)
+                _logger = logger
     return _logger
 
 
 def set_audit_logger(logger: logging.Logger) -> None:
     """Set the audit logger (e.g. from application config)."""
     global _logger
-    _logger = logger
+    with _logger_lock:
+        _logger = logger
 
 
 def _ts() -> str:
@@ -11,7 +11,7 @@ import hashlib
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, BinaryIO, Optional, Union
 
 import yaml
 
@@ -96,19 +96,24 @@ def _remote_execution_settings(config: dict) -> dict:
     }
 
 
+def _sha256_stream(f: BinaryIO) -> str:
+    """Compute SHA256 hex digest of a readable binary stream (chunked for large files)."""
+    h = hashlib.sha256()
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        h.update(chunk)
+    return h.hexdigest()
+
+
 def _sha256_local(path: Union[str, Path]) -> str:
     """Compute SHA256 hex digest of local file (chunked for large files)."""
-    h = hashlib.sha256()
     path = Path(path)
     if not path.is_file():
         raise FileNotFoundError(str(path))
     with open(path, "rb") as f:
-        while True:
-            chunk = f.read(CHUNK_SIZE)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+        return _sha256_stream(f)
 
 
 def _shell_quote(s: str) -> str:
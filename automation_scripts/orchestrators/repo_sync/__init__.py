@@ -11,6 +11,7 @@ from .repo_sync import (
     sync_repository_to_vm,
     sync_repository_to_all_vms,
     check_repo_status,
+    check_repo_status_many,
     verify_sync,
 )
 from .secret_scanner import SecretScanResult, scan_repository
@@ -22,6 +23,7 @@ __all__ = [
     "sync_repository_to_vm",
     "sync_repository_to_all_vms",
     "check_repo_status",
+    "check_repo_status_many",
     "verify_sync",
     "SecretScanResult",
     "scan_repository",
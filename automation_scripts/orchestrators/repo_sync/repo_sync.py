@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -23,6 +24,7 @@ from automation_scripts.orchestrators.remote_executor import execute_remote_comm
 from automation_scripts.orchestrators.remote_executor.ssh_key_manager import get_key_base_dir
 
 SYNC_REV_FILE = ".sync_rev"
+STATUS_CHECK_MAX_WORKERS = 8  # upper bound on concurrent SSH sessions in check_repo_status_many
 
 
 def _ts_utc() -> str:
@@ -303,8 +305,9 @@ def check_repo_status(
     user: str = "sync",
     config_path: Optional[Union[str, Path]] = None,
     config: Optional[dict] = None,
+    expected_hash: Optional[str] = None,
 ) -> RepoStatus:
-    """Read .sync_rev on target via execute_remote_command; compare with VM04 hash."""
+    """Read .sync_rev on target via execute_remote_command; compare with VM04 hash (or expected_hash if given)."""
     cfg = config or _load_config(config_path)
     opts = _repository_settings(cfg)
     main_path = Path(opts["main_repo_path"]).expanduser().resolve()
@@ -320,8 +323,8 @@ def check_repo_status(
             error=f"vm_id {vm_id} not in repository.vm_repo_paths",
         )
     remote_path = vm_paths[vm_id]
-    gm = GitManager(main_path)
-    expected_hash = gm.get_commit_hash("HEAD")
+    if expected_hash is None:
+        expected_hash = GitManager(main_path).get_commit_hash("HEAD")
     try:
         res = execute_remote_command(
             vm_id,
@@ -351,6 +354,35 @@ def check_repo_status(
     )
 
 
+def check_repo_status_many(
+    vm_ids: Optional[list[str]] = None,
+    *,
+    user: str = "sync",
+    config_path: Optional[Union[str, Path]] = None,
+    config: Optional[dict] = None,
+    max_workers: Optional[int] = None,
+) -> dict[str, RepoStatus]:
+    """
+    Run check_repo_status for several VMs in parallel (default: all push targets). Returns vm_id -> RepoStatus.
+
+    The VM04 HEAD hash is resolved once up front; workers only do the remote .sync_rev reads.
+    Duplicate vm_ids are checked once (first-seen order).
+    """
+    cfg = config or _load_config(config_path)
+    ids = list(dict.fromkeys(vm_ids)) if vm_ids is not None else _target_vm_ids(cfg)
+    if not ids:
+        return {}
+    main_path = Path(_repository_settings(cfg)["main_repo_path"]).expanduser().resolve()
+    expected_hash = GitManager(main_path).get_commit_hash("HEAD")
+    workers = max_workers or min(len(ids), STATUS_CHECK_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            vid: pool.submit(check_repo_status, vid, user=user, config=cfg, expected_hash=expected_hash)
+            for vid in ids
+        }
+    return {vid: fut.result() for vid, fut in futures.items()}
+
+
 def verify_sync(
     expected_commit: Optional[str] = None,
     *,
@@ -1,8 +1,11 @@
 """Unit tests for audit_logger."""
 
 import logging
+import threading
+
 import pytest
 
+from automation_scripts.orchestrators.remote_executor import audit_logger
 from automation_scripts.orchestrators.remote_executor.audit_logger import (
     get_audit_logger,
     set_audit_logger,
@@ -39,3 +42,32 @@ def test_log_operation_extra_safe():
     )
     # No crash; password/key filtered in implementation
     assert handlers_before >= 0
+
+
+def test_get_audit_logger_lazy_init_is_thread_safe(monkeypatch):
+    """A concurrent caller never gets the logger before its handler and INFO level are set."""
+    fresh = logging.Logger("remote_executor.audit.test")
+    in_init, release = threading.Event(), threading.Event()
+    real_add_handler = fresh.addHandler
+
+    def slow_add_handler(h):
+        in_init.set()
+        release.wait(timeout=5)
+        real_add_handler(h)
+
+    monkeypatch.setattr(fresh, "addHandler", slow_add_handler)
+    monkeypatch.setattr(audit_logger.logging, "getLogger", lambda name=None: fresh)
+    monkeypatch.setattr(audit_logger, "_logger", None)
+
+    seen = {}
+    first = threading.Thread(target=get_audit_logger)
+    second = threading.Thread(target=lambda: seen.update(level=get_audit_logger().level))
+    first.start()
+    assert in_init.wait(timeout=5)
+    second.start()
+    second.join(timeout=0.5)  # without the lock it returns here with a half-configured logger
+    release.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+    assert seen["level"] == logging.INFO
+    assert len(fresh.handlers) == 1
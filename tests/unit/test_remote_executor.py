@@ -1,5 +1,8 @@
 """Unit tests for remote_executor (execute_remote_command, vm_id validation, result shape)."""
 
+import copy
+import hashlib
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,53 +18,70 @@ from automation_scripts.orchestrators.remote_executor.remote_executor import (
     _get_vm_connection_params,
     _load_config,
     _sha256_local,
+    _sha256_stream,
 )
 
 
-@pytest.fixture
-def miniconfig():
-    return {
-        "vms": {
-            "vm01": {"ip": "192.168.1.1", "ssh_user": "u", "ssh_port": 22, "enabled": True},
-        },
-        "remote_execution": {"default_timeout": 30, "default_retry": 2},
-    }
+_MINICONFIG = {
+    "vms": {
+        "vm01": {"ip": "192.168.1.1", "ssh_user": "u", "ssh_port": 22, "enabled": True},
+    },
+    "remote_execution": {"default_timeout": 30, "default_retry": 2},
+}
 
 
-def test_allowed_vm_ids_from_vms(miniconfig):
-    """_allowed_vm_ids returns vm ids with enabled=true from vms."""
-    assert "vm01" in _allowed_vm_ids(miniconfig)
+@pytest.fixture
+def miniconfig():
+    """Fresh copy of _MINICONFIG for tests that mutate it."""
+    return copy.deepcopy(_MINICONFIG)
 
 
-def test_allowed_vm_ids_from_remote_execution(miniconfig):
-    """_allowed_vm_ids uses remote_execution.allowed_vm_ids when present."""
-    miniconfig["remote_execution"]["allowed_vm_ids"] = ["vm02"]
-    assert _allowed_vm_ids(miniconfig) == ["vm02"]
+@pytest.fixture(scope="module")
+def miniconfig_ro():
+    """Shared _MINICONFIG for read-only tests (no per-test copy)."""
+    return _MINICONFIG
 
 
-def test_get_vm_connection_params(miniconfig):
-    """_get_vm_connection_params returns host, port, username."""
-    p = _get_vm_connection_params(miniconfig, "vm01")
-    assert p["host"] == "192.168.1.1"
-    assert p["port"] == 22
-    assert p["username"] == "u"
+@pytest.mark.parametrize(
+    "allowed_vm_ids,expected",
+    [(None, ["vm01"]), (["vm02"], ["vm02"])],
+    ids=["from_vms", "from_remote_execution"],
+)
+def test_allowed_vm_ids(miniconfig, allowed_vm_ids, expected):
+    """_allowed_vm_ids uses remote_execution.allowed_vm_ids when present, else enabled vms."""
+    if allowed_vm_ids is not None:
+        miniconfig["remote_execution"]["allowed_vm_ids"] = allowed_vm_ids
+    assert _allowed_vm_ids(miniconfig) == expected
 
 
-def test_get_vm_connection_params_missing_vm(miniconfig):
-    """_get_vm_connection_params raises ValueError for unknown vm_id."""
-    with pytest.raises(ValueError):
-        _get_vm_connection_params(miniconfig, "vm99")
+@pytest.mark.parametrize(
+    "vm_id,expected",
+    [("vm01", {"host": "192.168.1.1", "port": 22, "username": "u"}), ("vm99", ValueError)],
+    ids=["known_vm", "missing_vm"],
+)
+def test_get_vm_connection_params(miniconfig_ro, vm_id, expected):
+    """_get_vm_connection_params returns host, port, username; raises ValueError for unknown vm_id."""
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            _get_vm_connection_params(miniconfig_ro, vm_id)
+    else:
+        assert _get_vm_connection_params(miniconfig_ro, vm_id) == expected
 
 
 def test_sha256_local(tmp_path):
     """_sha256_local returns hex digest of file."""
     f = tmp_path / "f.txt"
     f.write_text("hello")
-    import hashlib
     expected = hashlib.sha256(b"hello").hexdigest()
     assert _sha256_local(f) == expected
 
 
+def test_sha256_local_stream():
+    """_sha256_stream hashes an open binary stream without touching the filesystem."""
+    expected = hashlib.sha256(b"hello").hexdigest()
+    assert _sha256_stream(io.BytesIO(b"hello")) == expected
+
+
 @patch("automation_scripts.orchestrators.remote_executor.remote_executor.get_private_key_for_vm")
 @patch("automation_scripts.orchestrators.remote_executor.remote_executor.SSHClient")
 def test_execute_remote_command_success(mock_ssh_class, mock_get_key, miniconfig):
@@ -84,8 +104,24 @@ def test_execute_remote_command_success(mock_ssh_class, mock_get_key, miniconfig
     assert result.execution_time >= 0
 
 
-def test_execute_remote_command_vm_id_not_allowed(miniconfig):
+@patch("automation_scripts.orchestrators.remote_executor.remote_executor.get_private_key_for_vm")
+@patch("automation_scripts.orchestrators.remote_executor.remote_executor.SSHClient")
+def test_execute_remote_command_retries_after_connect_failure(mock_ssh_class, mock_get_key, miniconfig):
+    """execute_remote_command retries with backoff and returns the result of the next attempt."""
+    mock_get_key.return_value = MagicMock()
+    failing = MagicMock()
+    failing.connect.side_effect = OSError("connection reset")
+    ok = MagicMock()
+    ok.execute.return_value = ("out", "", 0)
+    mock_ssh_class.side_effect = [failing, ok]
+
+    result = execute_remote_command("vm01", "echo hi", "user1", 10.0, config=miniconfig, retries=2)
+    assert result.success is True
+    assert mock_ssh_class.call_count == 2
+
+
+def test_execute_remote_command_vm_id_not_allowed(miniconfig_ro):
     """execute_remote_command raises ValueError when vm_id not in allowed list."""
     with pytest.raises(ValueError) as exc:
-        execute_remote_command("vm99", "echo hi", "user1", 10.0, config=miniconfig)
+        execute_remote_command("vm99", "echo hi", "user1", 10.0, config=miniconfig_ro)
     assert "vm99" in str(exc.value)
@@ -1,15 +1,20 @@
 """Unit tests for repo_sync (sync_repository_to_vm, check_repo_status, verify_sync)."""
 
+import copy
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from automation_scripts.orchestrators.remote_executor import RemoteExecutionResult
 from automation_scripts.orchestrators.repo_sync import (
     RepoStatus,
     sync_repository_to_vm,
     sync_repository_to_all_vms,
     check_repo_status,
+    check_repo_status_many,
     verify_sync,
 )
 from automation_scripts.orchestrators.repo_sync.secret_scanner import SecretScanResult
@@ -20,54 +25,89 @@ from automation_scripts.orchestrators.repo_sync.repo_sync import (
 )
 
 
+_MINICONFIG = {
+    "vms": {
+        "vm01": {"ip": "192.168.1.1", "ssh_user": "u", "ssh_port": 22, "enabled": True},
+        "vm02": {"ip": "192.168.1.2", "ssh_user": "u", "ssh_port": 22, "enabled": True},
+        "vm04": {"ip": "192.168.1.4", "ssh_user": "u", "ssh_port": 22, "enabled": True},
+    },
+    "repository": {
+        "main_repo_path": "/opt/th_timmy",
+        "vm_repo_paths": {"vm01": "/home/u/th_timmy", "vm02": "/home/u/th_timmy", "vm04": "/opt/th_timmy"},
+        "default_branch": "main",
+        "rsync_excludes": [".git", "__pycache__"],
+        "exclude_dot_git": True,
+    },
+    "remote_execution": {"key_storage_path": "~/.ssh/th_timmy_keys"},
+}
+
+
 @pytest.fixture
 def miniconfig():
-    return {
-        "vms": {
-            "vm01": {"ip": "192.168.1.1", "ssh_user": "u", "ssh_port": 22, "enabled": True},
-            "vm02": {"ip": "192.168.1.2", "ssh_user": "u", "ssh_port": 22, "enabled": True},
-            "vm04": {"ip": "192.168.1.4", "ssh_user": "u", "ssh_port": 22, "enabled": True},
-        },
-        "repository": {
-            "main_repo_path": "/opt/th_timmy",
-            "vm_repo_paths": {"vm01": "/home/u/th_timmy", "vm02": "/home/u/th_timmy", "vm04": "/opt/th_timmy"},
-            "default_branch": "main",
-            "rsync_excludes": [".git", "__pycache__"],
-            "exclude_dot_git": True,
-        },
-        "remote_execution": {"key_storage_path": "~/.ssh/th_timmy_keys"},
-    }
-
-
-def test_target_vm_ids_excludes_vm04(miniconfig):
-    """_target_vm_ids returns vm01, vm02 (not vm04) when push_targets not set."""
-    ids = _target_vm_ids(miniconfig)
-    assert "vm04" not in ids
-    assert "vm01" in ids
-    assert "vm02" in ids
-
-
-def test_target_vm_ids_uses_push_targets(miniconfig):
-    """_target_vm_ids uses repository.push_targets when set."""
-    miniconfig["repository"]["push_targets"] = ["vm01"]
-    assert _target_vm_ids(miniconfig) == ["vm01"]
-
-
-def test_repository_settings_defaults(miniconfig):
+    """Fresh copy of _MINICONFIG for tests that mutate it."""
+    return copy.deepcopy(_MINICONFIG)
+
+
+@pytest.fixture(scope="module")
+def miniconfig_ro():
+    """Shared _MINICONFIG for read-only tests (no per-test copy)."""
+    return _MINICONFIG
+
+
+@pytest.fixture(autouse=True)
+def _no_gitleaks(monkeypatch):
+    """Never fork gitleaks from unit tests; default to a clean scan (tests override with patch)."""
+    monkeypatch.setattr(
+        "automation_scripts.orchestrators.repo_sync.repo_sync.scan_repository",
+        lambda *args, **kwargs: SecretScanResult(has_secrets=False, secrets_found=[], scan_timestamp=""),
+    )
+
+
+@pytest.fixture
+def mocked_repo_sync(monkeypatch, miniconfig):
+    """Patch repo_sync's config loader, GitManager (HEAD abc123) and rsync (success); returns the handles."""
+    gm = SimpleNamespace(get_commit_hash=lambda *args: "abc123", pull_repository=lambda *args: None)
+    rsync = MagicMock(return_value=(True, ""))
+    mod = "automation_scripts.orchestrators.repo_sync.repo_sync"
+    monkeypatch.setattr(f"{mod}._load_config", lambda *args, **kwargs: miniconfig)
+    monkeypatch.setattr(f"{mod}.GitManager", lambda *args, **kwargs: gm)
+    monkeypatch.setattr(f"{mod}._run_rsync", rsync)
+    return SimpleNamespace(config=miniconfig, git_manager=gm, run_rsync=rsync)
+
+
+@pytest.mark.parametrize(
+    "push_targets,expected",
+    [(None, ["vm01", "vm02"]), (["vm01"], ["vm01"])],
+    ids=["excludes_vm04", "uses_push_targets"],
+)
+def test_target_vm_ids(miniconfig, push_targets, expected):
+    """_target_vm_ids uses repository.push_targets when set, else enabled vms except vm04."""
+    if push_targets is not None:
+        miniconfig["repository"]["push_targets"] = push_targets
+    assert _target_vm_ids(miniconfig) == expected
+
+
+def test_repository_settings_defaults(miniconfig_ro):
     """_repository_settings returns main_repo_path, vm_repo_paths, default_branch, etc."""
-    opts = _repository_settings(miniconfig)
+    opts = _repository_settings(miniconfig_ro)
     assert opts["main_repo_path"] == "/opt/th_timmy"
     assert opts["vm_repo_paths"]["vm01"] == "/home/u/th_timmy"
     assert opts["default_branch"] == "main"
     assert opts["exclude_dot_git"] is True
 
 
-def test_get_vm_connection_params(miniconfig):
-    """_get_vm_connection_params returns host, port, username from vms."""
-    p = _get_vm_connection_params(miniconfig, "vm01")
-    assert p["host"] == "192.168.1.1"
-    assert p["port"] == 22
-    assert p["username"] == "u"
+@pytest.mark.parametrize(
+    "vm_id,expected",
+    [("vm01", {"host": "192.168.1.1", "port": 22, "username": "u"}), ("vm99", ValueError)],
+    ids=["known_vm", "missing_vm"],
+)
+def test_get_vm_connection_params(miniconfig_ro, vm_id, expected):
+    """_get_vm_connection_params returns host, port, username from vms; raises ValueError for unknown vm_id."""
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            _get_vm_connection_params(miniconfig_ro, vm_id)
+    else:
+        assert _get_vm_connection_params(miniconfig_ro, vm_id) == expected
 
 
 def test_sync_repository_to_vm_main_path_not_dir(miniconfig):
@@ -95,47 +135,98 @@ def test_sync_repository_to_vm_blocked_by_secrets(miniconfig, tmp_path):
     assert "secrets" in (st.error or "").lower()
 
 
-def test_sync_repository_to_vm_success_skips_rsync_with_mock(miniconfig, tmp_path):
+def test_sync_repository_to_vm_success_skips_rsync_with_mock(mocked_repo_sync, tmp_path):
     """sync_repository_to_vm returns RepoStatus with is_synced=True when git pull and rsync succeed."""
     repo = tmp_path / "repo"
     repo.mkdir()
     (repo / ".git").mkdir()
+    miniconfig = mocked_repo_sync.config
     miniconfig["repository"]["main_repo_path"] = str(repo)
     miniconfig["repository"]["vm_repo_paths"]["vm01"] = "/remote/th_timmy"
 
-    with patch("automation_scripts.orchestrators.repo_sync.repo_sync._load_config", return_value=miniconfig):
-        with patch(
-            "automation_scripts.orchestrators.repo_sync.repo_sync.scan_repository",
-            return_value=SecretScanResult(has_secrets=False, secrets_found=[], scan_timestamp=""),
-        ):
-            with patch("automation_scripts.orchestrators.repo_sync.repo_sync.GitManager") as GM:
-                gm = MagicMock()
-                gm.get_commit_hash.return_value = "abc123"
-                GM.return_value = gm
-                with patch("automation_scripts.orchestrators.repo_sync.repo_sync._run_rsync", return_value=(True, "")):
-                    st = sync_repository_to_vm("vm01", config=miniconfig, run_secret_scan=True)
+    st = sync_repository_to_vm("vm01", config=miniconfig, run_secret_scan=True)
     assert st.is_synced is True
     assert st.commit_hash == "abc123"
     assert st.vm_id == "vm01"
+    assert mocked_repo_sync.run_rsync.call_count == 1
 
 
-def test_check_repo_status_calls_execute_remote_command(miniconfig):
+def test_check_repo_status_calls_execute_remote_command(mocked_repo_sync):
     """check_repo_status uses execute_remote_command to read .sync_rev on target."""
+    miniconfig = mocked_repo_sync.config
     miniconfig["repository"]["main_repo_path"] = "/opt/th_timmy"
-    with patch("automation_scripts.orchestrators.repo_sync.repo_sync._load_config", return_value=miniconfig):
-        with patch("automation_scripts.orchestrators.repo_sync.repo_sync.GitManager") as GM:
-            gm = MagicMock()
-            gm.get_commit_hash.return_value = "abc123"
-            GM.return_value = gm
-            with patch(
-                "automation_scripts.orchestrators.repo_sync.repo_sync.execute_remote_command",
-                return_value=MagicMock(stdout="abc123\n", success=True),
-            ):
-                st = check_repo_status("vm01", config=miniconfig)
+    with patch(
+        "automation_scripts.orchestrators.repo_sync.repo_sync.execute_remote_command",
+        return_value=RemoteExecutionResult(
+            stdout="abc123\n", stderr="", exit_code=0, execution_time=0.0,
+            timestamp="", vm_id="vm01", command="", success=True,
+        ),
+    ):
+        st = check_repo_status("vm01", config=miniconfig)
     assert st.is_synced is True
     assert st.commit_hash == "abc123"
 
 
+def test_check_repo_status_many_defaults_to_push_targets(mocked_repo_sync):
+    """check_repo_status_many checks every target VM (not vm04) and returns vm_id -> RepoStatus."""
+    def side_effect(vm_id, **kwargs):
+        return RepoStatus(vm_id, "main", "abc123", True, "", "n/a")
+
+    with patch("automation_scripts.orchestrators.repo_sync.repo_sync.check_repo_status", side_effect=side_effect) as cs:
+        out = check_repo_status_many(config=mocked_repo_sync.config)
+    assert sorted(out) == ["vm01", "vm02"]
+    assert out["vm02"].vm_id == "vm02"
+    assert cs.call_count == 2
+
+
+def test_check_repo_status_many_dedupes_vm_ids(mocked_repo_sync):
+    """Duplicate vm_ids are checked once each, in first-seen order."""
+    def side_effect(vm_id, **kwargs):
+        return RepoStatus(vm_id, "main", "abc123", True, "", "n/a")
+
+    with patch("automation_scripts.orchestrators.repo_sync.repo_sync.check_repo_status", side_effect=side_effect) as cs:
+        out = check_repo_status_many(["vm02", "vm01", "vm02"], config=mocked_repo_sync.config)
+    assert list(out) == ["vm02", "vm01"]
+    assert cs.call_count == 2
+
+
+def test_check_repo_status_many_explicit_vm_ids_run_concurrently(mocked_repo_sync, monkeypatch):
+    """check_repo_status_many resolves the VM04 hash once and runs the per-VM checks in parallel."""
+    miniconfig = mocked_repo_sync.config
+    git_manager_cls = MagicMock(return_value=mocked_repo_sync.git_manager)
+    monkeypatch.setattr("automation_scripts.orchestrators.repo_sync.repo_sync.GitManager", git_manager_cls)
+    # Both checks must be in flight at once to pass the barrier; a sequential run times out.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def side_effect(vm_id, **kwargs):
+        barrier.wait()
+        return RepoStatus(vm_id, "main", "abc123", True, "", "n/a")
+
+    with patch("automation_scripts.orchestrators.repo_sync.repo_sync.check_repo_status", side_effect=side_effect) as cs:
+        out = check_repo_status_many(["vm02", "vm01"], user="auditor", config=miniconfig)
+    assert sorted(out) == ["vm01", "vm02"]
+    assert git_manager_cls.call_count == 1
+    assert sorted(c.args[0] for c in cs.call_args_list) == ["vm01", "vm02"]
+    for c in cs.call_args_list:
+        assert c.kwargs == {"user": "auditor", "config": miniconfig, "expected_hash": "abc123"}
+
+
+def test_check_repo_status_uses_given_expected_hash(mocked_repo_sync, monkeypatch):
+    """check_repo_status skips the local git lookup when expected_hash is passed."""
+    git_manager_cls = MagicMock()
+    monkeypatch.setattr("automation_scripts.orchestrators.repo_sync.repo_sync.GitManager", git_manager_cls)
+    with patch(
+        "automation_scripts.orchestrators.repo_sync.repo_sync.execute_remote_command",
+        return_value=RemoteExecutionResult(
+            stdout="def456\n", stderr="", exit_code=0, execution_time=0.0,
+            timestamp="", vm_id="vm01", command="", success=True,
+        ),
+    ):
+        st = check_repo_status("vm01", config=mocked_repo_sync.config, expected_hash="def456")
+    assert st.is_synced is True
+    git_manager_cls.assert_not_called()
+
+
 def test_verify_sync_true_when_all_match(miniconfig):
     """verify_sync returns True when all targets have same hash as VM04."""
     miniconfig["repository"]["main_repo_path"] = "/opt/th_timmy"
@@ -146,16 +237,23 @@ def test_verify_sync_true_when_all_match(miniconfig):
     assert out is True
 
 
-def test_verify_sync_false_when_one_mismatches(miniconfig):
-    """verify_sync returns False when any target has different hash."""
+@pytest.mark.parametrize(
+    "mismatched_vm,expected_calls",
+    [("vm01", 1), ("vm02", 2)],
+    ids=["first_target", "last_target"],
+)
+def test_verify_sync_false_when_one_mismatches(miniconfig, mismatched_vm, expected_calls):
+    """verify_sync returns False when any target has different hash, stopping at the first mismatch."""
     miniconfig["repository"]["main_repo_path"] = "/opt/th_timmy"
     call_count = [0]
 
     def side_effect(vm_id, **kwargs):
         call_count[0] += 1
-        return RepoStatus(vm_id, "main", "abc123" if vm_id == "vm01" else "other", vm_id == "vm01", "", "n/a")
+        synced = vm_id != mismatched_vm
+        return RepoStatus(vm_id, "main", "abc123" if synced else "other", synced, "", "n/a")
 
     with patch("automation_scripts.orchestrators.repo_sync.repo_sync._load_config", return_value=miniconfig):
         with patch("automation_scripts.orchestrators.repo_sync.repo_sync.check_repo_status", side_effect=side_effect):
             out = verify_sync(expected_commit="abc123", config=miniconfig)
     assert out is False
+    assert call_count[0] == expected_calls
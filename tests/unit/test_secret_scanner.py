@@ -1,5 +1,6 @@
 """Unit tests for repo_sync.secret_scanner (scan_repository, SecretScanResult)."""
 
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -22,7 +23,7 @@ def test_scan_repository_clean(tmp_path):
     """scan_repository returns has_secrets=False when gitleaks exits 0."""
     (tmp_path / ".git").mkdir()
     with patch("subprocess.run") as m:
-        m.return_value = type("R", (), {"returncode": 0, "stdout": "", "stderr": ""})()
+        m.return_value = SimpleNamespace(returncode=0, stdout="", stderr="")
         res = scan_repository(tmp_path)
     assert res.has_secrets is False
     assert res.secrets_found == []
@@ -32,11 +33,11 @@ def test_scan_repository_secrets_found(tmp_path):
     """scan_repository returns has_secrets=True when gitleaks finds secrets (exit 1, JSON)."""
     (tmp_path / ".git").mkdir()
     with patch("subprocess.run") as m:
-        m.return_value = type("R", (), {
-            "returncode": 1,
-            "stdout": '[{"File":"x","RuleID":"y","StartLine":1}]',
-            "stderr": "",
-        })()
+        m.return_value = SimpleNamespace(
+            returncode=1,
+            stdout='[{"File":"x","RuleID":"y","StartLine":1}]',
+            stderr="",
+        )
         res = scan_repository(tmp_path)
     assert res.has_secrets is True
     assert len(res.secrets_found) == 1
@@ -43,3 +43,13 @@ def test_ssh_client_execute_returns_stdout_stderr_exit_code():
     stdout, stderr, exit_code = client.execute("echo hello", timeout=5.0)
     assert "hello" in stdout or stdout == "hello"
     assert exit_code == 0
+
+
+def test_ssh_client_connect_blocked_without_network():
+    """SSHClient.connect fails fast in unit tests instead of dialing a real host."""
+    client = SSHClient(host="127.0.0.1", port=22, username="test", pkey=MagicMock(), connect_timeout=1.0)
+    try:
+        with pytest.raises(RuntimeError, match="must not open network connections"):
+            client.connect()
+    finally:
+        client._cleanup()